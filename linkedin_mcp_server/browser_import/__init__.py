@@ -1,20 +1,29 @@
 """Import a LinkedIn session from a locally logged-in Chromium-family browser.
 
-The package exposes the discovery and extraction primitives eagerly. The
-orchestrator entry point is imported lazily inside ``import_session_from_browser``
-so that importing this package never pulls in ``drivers.browser`` (which imports
+The package exposes the discovery primitives eagerly. The orchestrator entry
+point is imported lazily inside ``import_session_from_browser`` so that
+importing this package never pulls in ``drivers.browser`` (which imports
 ``config``). That avoids a config -> browser_import -> drivers.browser -> config
 import cycle when ``config/schema.py`` references ``SUPPORTED_BROWSERS``.
+
+The extraction primitives are lazy too, through the module ``__getattr__``.
+``config/schema.py`` reaches this package on every config validation, and
+``extract`` brings ``cryptography``, ``sqlite3`` and ``subprocess`` with it,
+which only ``--import-from-browser`` and the auto-import ever use.
 """
 
 from __future__ import annotations
 
 from collections.abc import Coroutine
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .discovery import SUPPORTED_BROWSERS, BrowserProfile, discover_profiles
-from .extract import LinkedInCookie, extract_linkedin_cookies
+
+if TYPE_CHECKING:
+    from .extract import LinkedInCookie, extract_linkedin_cookies
+
+_LAZY_EXTRACT_NAMES = frozenset({"LinkedInCookie", "extract_linkedin_cookies"})
 
 __all__ = [
     "SUPPORTED_BROWSERS",
@@ -35,3 +44,11 @@ def import_session_from_browser(
     from .orchestrate import import_session_from_browser as _impl
 
     return _impl(browser, user_data_dir=user_data_dir)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXTRACT_NAMES:
+        from . import extract
+
+        return getattr(extract, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
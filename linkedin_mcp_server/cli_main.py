@@ -6,8 +6,6 @@ import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
-import inquirer
-
 from linkedin_mcp_server.bootstrap import (
     configure_browser_environment,
     ensure_browser_installed,
@@ -51,6 +49,10 @@ logger = logging.getLogger(__name__)
 
 def choose_transport_interactive() -> Literal["stdio", "streamable-http"]:
     """Prompt user for transport mode using inquirer."""
+    # Imported here: it pulls in a terminal UI stack that only this prompt
+    # uses, and most launches come from an MCP client that never sees it.
+    import inquirer
+
     questions = [
         inquirer.List(
             "transport",
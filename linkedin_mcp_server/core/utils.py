@@ -1,7 +1,10 @@
 """Utility functions for scraping operations."""
 
 import asyncio
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 import logging
+from typing import Any
 
 from patchright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 
@@ -10,6 +13,30 @@ from .exceptions import RateLimitError
 logger = logging.getLogger(__name__)
 
 
+def parse_retry_after(value: Any) -> float | None:
+    """Read a ``Retry-After`` header value as seconds from now.
+
+    Accepts both forms the header allows: a non-negative integer number of
+    seconds, and an HTTP-date. A date already in the past reads as zero.
+    Anything else, including a missing header, returns None so the caller
+    falls back to its own backoff rather than trusting a value it could not
+    parse.
+    """
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    # isdigit() alone also accepts digits float() cannot read, such as "²".
+    if value.isascii() and value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
 async def detect_rate_limit(page: Page) -> None:
     """Detect if LinkedIn has rate-limited or security-challenged the session.
 
@@ -76,8 +103,16 @@ async def scroll_to_bottom(
         max_scrolls: Maximum number of scroll attempts
     """
     for i in range(max_scrolls):
-        previous_height = await page.evaluate("document.body.scrollHeight")
-        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        # Read the height and scroll in one round trip. The pause stays on this
+        # side: the page may be hidden, and Chromium throttles a hidden page's
+        # timers, so an in-page wait could run far longer than asked.
+        previous_height = await page.evaluate(
+            """() => {
+                const height = document.body.scrollHeight;
+                window.scrollTo(0, height);
+                return height;
+            }"""
+        )
         await asyncio.sleep(pause_time)
 
         new_height = await page.evaluate("document.body.scrollHeight")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import itertools
 import json
 import os
@@ -114,17 +115,38 @@ def _safe_source_profile_dir() -> Path:
         return Path("~/.linkedin-mcp/profile").expanduser()
 
 
+def _prepare_screenshot_dir(trace_dir: Path) -> Path:
+    secure_mkdir(trace_dir)
+    screenshot_dir = trace_dir / "screens"
+    secure_mkdir(screenshot_dir)
+    return screenshot_dir
+
+
+def _append_trace_record(trace_jsonl: Path, payload: dict[str, Any]) -> None:
+    try:
+        fd = os.open(str(trace_jsonl), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        os.close(fd)
+    except FileExistsError:
+        pass
+    with trace_jsonl.open("a", encoding="utf-8") as fh:
+        fh.write(json.dumps(payload, ensure_ascii=True) + "\n")
+
+
 async def record_page_trace(
     page: Any, step: str, *, extra: dict[str, Any] | None = None
 ) -> None:
-    """Persist a screenshot and basic page state when trace capture is enabled."""
+    """Persist a screenshot and basic page state when trace capture is enabled.
+
+    Tracing is on by default (``on_error`` keeps a run only if it fails), so
+    this runs around every navigation. The directory setup and the append go
+    to a worker thread: they are blocking filesystem calls, and on a slow or
+    synced home directory they would stall every other task on the loop.
+    """
     trace_dir = get_trace_dir()
     if trace_dir is None:
         return
 
-    secure_mkdir(trace_dir)
-    screenshot_dir = trace_dir / "screens"
-    secure_mkdir(screenshot_dir)
+    screenshot_dir = await asyncio.to_thread(_prepare_screenshot_dir, trace_dir)
     step_id = next(_TRACE_COUNTER)
     slug = _slugify_step(step) or "step"
 
@@ -180,11 +202,4 @@ async def record_page_trace(
         "extra": extra or {},
     }
 
-    trace_jsonl = trace_dir / "trace.jsonl"
-    try:
-        fd = os.open(str(trace_jsonl), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
-        os.close(fd)
-    except FileExistsError:
-        pass
-    with trace_jsonl.open("a", encoding="utf-8") as fh:
-        fh.write(json.dumps(payload, ensure_ascii=True) + "\n")
+    await asyncio.to_thread(_append_trace_record, trace_dir / "trace.jsonl", payload)
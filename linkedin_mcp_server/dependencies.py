@@ -1,7 +1,8 @@
 """Helpers used by MCP tools after bootstrap gating."""
 
+import functools
 import logging
-from typing import NoReturn
+from typing import Any, NoReturn
 
 from fastmcp import Context
 
@@ -19,6 +20,7 @@ from linkedin_mcp_server.drivers.browser import (
     close_browser,
     ensure_authenticated,
     get_or_create_browser,
+    on_browser_closed,
 )
 from linkedin_mcp_server.error_handler import raise_tool_error
 from linkedin_mcp_server.exceptions import (
@@ -159,6 +161,30 @@ async def handle_auth_error(
     )  # always raises
 
 
+@functools.lru_cache(maxsize=1)
+def _extractor_for(page: Any) -> LinkedInExtractor:
+    """The extractor bound to *page*, built once per page.
+
+    Keyed on the page object itself, so a browser that was closed and launched
+    again hands out a fresh extractor with its first call, and a stale one can
+    never drive a page that no longer exists. Closing the browser also clears
+    the cache, so the closed page and the cached results of the people it
+    looked up are not kept alive until that next call. Between calls the extractor
+    holds the page, what it last learned about throttling and its profile and
+    search caches, all of which belong to that page's session, so reusing it
+    is safe.
+    """
+    return LinkedInExtractor(page)
+
+
+on_browser_closed(_extractor_for.cache_clear)
+
+
+def reset_extractor_for_testing() -> None:
+    """Forget the cached extractor, and with it its result caches."""
+    _extractor_for.cache_clear()
+
+
 async def get_ready_extractor(
     ctx: Context | None,
     *,
@@ -169,7 +195,7 @@ async def get_ready_extractor(
         await ensure_tool_ready_or_raise(tool_name, ctx)
         browser = await get_or_create_browser()
         await ensure_authenticated()
-        return LinkedInExtractor(browser.page)
+        return _extractor_for(browser.page)
     except AuthenticationError as e:
         # The first statement of every tool body, so a failure here means the
         # scrape has not started and the client may safely run the call again once
@@ -11,7 +11,7 @@ import logging
 import os
 import time
 from pathlib import Path
-from collections.abc import Coroutine
+from collections.abc import Callable, Coroutine
 from typing import Any, TypeVar
 
 from linkedin_mcp_server.common_utils import harden_linkedin_tree, secure_mkdir
@@ -98,9 +98,18 @@ _calls_in_flight: int = 0
 # the same profile, which is the very corruption this module prevents.
 _browser_lifecycle_lock = asyncio.Lock()
 
+# Run when the browser is torn down, so state built on its page elsewhere goes
+# with it instead of holding the closed page until the next tool call.
+_close_hooks: list[Callable[[], None]] = []
+
 T = TypeVar("T")
 
 
+def on_browser_closed(hook: Callable[[], None]) -> None:
+    """Call *hook* every time the browser is torn down. It must not raise."""
+    _close_hooks.append(hook)
+
+
 def _debug_skip_checkpoint_restart() -> bool:
     """Return whether to keep the fresh bridged browser alive for this run."""
     return os.getenv("LINKEDIN_DEBUG_SKIP_CHECKPOINT_RESTART", "").strip().lower() in {
@@ -858,6 +867,9 @@ async def _close_browser_locked() -> None:
     if browser is None:
         return
 
+    for hook in _close_hooks:
+        hook()
+
     logger.info("Closing browser...")
     if cookie_export_path is not None:
         try:
@@ -64,27 +64,17 @@ class CompactFormatter(logging.Formatter):
         Returns:
             Compact-formatted log string
         """
-        # Create a copy of the record to avoid modifying the original
-        record_copy = logging.LogRecord(
-            name=record.name,
-            level=record.levelno,
-            pathname=record.pathname,
-            lineno=record.lineno,
-            msg=record.msg,
-            args=record.args,
-            exc_info=record.exc_info,
-            func=record.funcName,
-        )
-        record_copy.stack_info = record.stack_info
-
-        # Shorten the logger name by removing the linkedin_mcp_server prefix
-        if record_copy.name.startswith("linkedin_mcp_server."):
-            record_copy.name = record_copy.name[len("linkedin_mcp_server.") :]
+        # Shorten the logger name by removing the linkedin_mcp_server prefix.
+        # Read into locals rather than onto a copied record: building a second
+        # LogRecord per line cost more than the formatting itself.
+        name = record.name
+        if name.startswith("linkedin_mcp_server."):
+            name = name[len("linkedin_mcp_server.") :]
 
         # Format the time as HH:MM:SS only
-        record_copy.asctime = self.formatTime(record_copy, datefmt="%H:%M:%S")
+        asctime = self.formatTime(record, datefmt="%H:%M:%S")
 
-        return f"{record_copy.asctime} - {record_copy.name} - {record.levelname} - {record.getMessage()}"
+        return f"{asctime} - {name} - {record.levelname} - {record.getMessage()}"
 
 
 def configure_logging(log_level: str = "WARNING", json_format: bool = False) -> None:
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 import json
 import logging
 import re
+import time
 from typing import TYPE_CHECKING, Any, Literal
 from urllib.parse import parse_qs, quote_plus, urljoin, urlparse
 
@@ -30,6 +31,7 @@ from linkedin_mcp_server.error_diagnostics import build_issue_diagnostics
 from linkedin_mcp_server.core.utils import (
     detect_rate_limit,
     handle_modal_close,
+    parse_retry_after,
     scroll_job_sidebar,
     scroll_to_bottom,
 )
@@ -41,6 +43,8 @@ from linkedin_mcp_server.scraping.link_metadata import (
 )
 
 from .fields import COMPANY_SECTIONS, PERSON_SECTIONS
+from .pacing import NavigationPacer
+from .result_cache import ResultCache
 
 if TYPE_CHECKING:
     from linkedin_mcp_server.callbacks import ProgressCallback
@@ -49,12 +53,37 @@ logger = logging.getLogger(__name__)
 
 WaitUntil = Literal["commit", "domcontentloaded", "load", "networkidle"]
 
-# Pacing between page navigations
+# Pacing between page navigations: the tuned baseline, which is also the floor
+# of the adaptive delay below, and the ceiling it backs off to. The pacer only
+# ever slows down from the baseline; going faster than it changes how the
+# browser behaves and would need measuring first.
 _NAV_DELAY = 2.0
+_MAX_NAV_DELAY = 30.0
+
+# How long a scraped profile is answered from memory. Short, because the main
+# profile carries the relationship state, which the server's own connection
+# requests change; those drop the entry outright.
+_PROFILE_CACHE_TTL = 15 * 60.0
+_PROFILE_CACHE_SIZE = 64
+
+# How long a people or company search is answered from memory. Shorter than a
+# profile: result order shifts as LinkedIn re-ranks, and a client repeating a
+# search within a few minutes is usually paging through the same answer.
+_SEARCH_CACHE_TTL = 5 * 60.0
+_SEARCH_CACHE_SIZE = 32
 
 # Backoff before retrying a temporarily blocked page
 _RATE_LIMIT_RETRY_DELAY = 5.0
 
+# Longest ``Retry-After`` the single in-call retry will sit out. A longer hint
+# would spend most of the tool's budget asleep, so the retry is skipped and the
+# hint is handed to the client in ``section_errors`` instead.
+_MAX_RATE_LIMIT_RETRY_DELAY = 30.0
+
+# Statuses on which a ``Retry-After`` header means "come back later". On a
+# redirect the same header means something else, so it is not read there.
+_RETRY_AFTER_STATUSES = frozenset({429, 503})
+
 # Returned as section text when a page comes back with its content gone and
 # only LinkedIn's own navigation and footer left.
 #
@@ -74,7 +103,9 @@ _RATE_LIMIT_RETRY_DELAY = 5.0
 _RATE_LIMITED_MSG = "[Rate limited] LinkedIn blocked this section. Try again later or request fewer sections."
 
 
-def rate_limited_section_error() -> dict[str, str]:
+def rate_limited_section_error(
+    retry_after: float | None = None,
+) -> dict[str, Any]:
     """The ``section_errors`` entry for a section that came back empty.
 
     One shape for every caller, because the alternative is what this codebase
@@ -87,11 +118,44 @@ def rate_limited_section_error() -> dict[str, str]:
     ``_RATE_LIMITED_MSG`` above, and does not make it more accurate. What it
     changes is that a wrong verdict is now visible and can be argued with,
     where a silently missing section could not be.
+
+    *retry_after* is the wait LinkedIn asked for in a ``Retry-After`` header,
+    when the navigation carried one. It is passed on as ``retry_after_seconds``
+    so a client can wait as long as the server said rather than guess.
     """
-    return {
+    error: dict[str, Any] = {
         "error_type": "rate_limit",
         "error_message": _RATE_LIMITED_MSG,
     }
+    if retry_after is not None:
+        error["retry_after_seconds"] = round(retry_after)
+    return error
+
+
+def _retry_after_hint(response: Any) -> float | None:
+    """The ``Retry-After`` of a throttled navigation response, if it sent one."""
+    if getattr(response, "status", None) not in _RETRY_AFTER_STATUSES:
+        return None
+    headers = getattr(response, "headers", None)
+    if not isinstance(headers, dict):
+        return None
+    # Patchright lower-cases header names.
+    return parse_retry_after(headers.get("retry-after"))
+
+
+# Module-level rather than per extractor: the extractor is rebuilt whenever the
+# browser is, and what LinkedIn tolerated on the last call is still the best
+# guess for this one.
+_navigation_pacer = NavigationPacer(
+    initial=_NAV_DELAY,
+    floor=_NAV_DELAY,
+    ceiling=_MAX_NAV_DELAY,
+)
+
+
+def reset_navigation_pacing_for_testing() -> None:
+    """Return the shared navigation pacer to its initial delay."""
+    _navigation_pacer.reset()
 
 
 # LinkedIn shows 25 results per page
@@ -164,6 +228,9 @@ _CONTENT_SCROLLS_PER_REQUESTED_PAGE = 5
 # LinkedIn accepts "F" (1st-degree), "S" (2nd-degree), "O" (3rd-degree and beyond).
 _NETWORK_TOKENS = ("F", "S", "O")
 
+# Pagination control inside ``main`` on /details/ pages.
+_SHOW_MORE_BUTTON_TEXT = re.compile(r"^Show (more|all)\b", re.IGNORECASE)
+
 _DIALOG_SELECTOR = 'dialog[open], [role="dialog"]'
 _DIALOG_PREMIUM_LINK_SELECTOR = (
     'dialog[open] a[href*="/premium/"], [role="dialog"] a[href*="/premium/"]'
@@ -479,6 +546,9 @@ _NOISE_LINES: list[re.Pattern[str]] = [
     re.compile(r"^(?:Show captions|Close modal window|Media player modal window)$"),
     re.compile(r"^(?:Loaded:.*|Remaining time.*|Stream Type.*)$"),
 ]
+# The line patterns joined into one, so each line is stripped and matched
+# once rather than once per pattern.
+_NOISE_LINE_RE = re.compile("|".join(f"(?:{p.pattern})" for p in _NOISE_LINES))
 
 
 @dataclass
@@ -494,10 +564,13 @@ _FEED_RSC_MARKER = "sduiid=com.linkedin.sdui.pagers.feed.mainFeed"
 # Matches a LinkedIn post permalink in either plain or JSON-escaped form
 # (the initial /feed/ HTML embeds the RSC flight data with \u002f for slashes,
 # while paginated responses use plain slashes). Captures the slug portion so
-# we can rebuild a canonical URL regardless of the source encoding.
+# we can rebuild a canonical URL regardless of the source encoding. A bytes
+# pattern, run on the raw body: the initial HTML runs to hundreds of KB, and
+# everything the pattern can match is ASCII, so decoding it first would copy the
+# whole payload for nothing.
 _POST_SLUG_URL_RE = re.compile(
-    r"linkedin\.com(?:\\u002[fF]|/)posts(?:\\u002[fF]|/)"
-    r"(?P<slug>[A-Za-z0-9_-]+?-(?:ugcPost|activity|share)-\d+-[A-Za-z0-9_-]+)"
+    rb"linkedin\.com(?:\\u002[fF]|/)posts(?:\\u002[fF]|/)"
+    rb"(?P<slug>[A-Za-z0-9_-]+?-(?:ugcPost|activity|share)-[0-9]+-[A-Za-z0-9_-]+)"
 )
 _FEED_DOCUMENT_URLS = {
     "https://www.linkedin.com/feed",
@@ -610,9 +683,7 @@ def strip_linkedin_noise(text: str) -> str:
 def _filter_linkedin_noise_lines(text: str) -> str:
     """Remove known media/control noise lines from already-truncated content."""
     filtered_lines = [
-        line
-        for line in text.splitlines()
-        if not any(pattern.match(line.strip()) for pattern in _NOISE_LINES)
+        line for line in text.splitlines() if not _NOISE_LINE_RE.match(line.strip())
     ]
     return "\n".join(filtered_lines).strip()
 
@@ -744,6 +815,57 @@ class LinkedInExtractor:
 
     def __init__(self, page: Page):
         self._page = page
+        # ``Retry-After`` of the most recent navigation, when it was throttled.
+        self._retry_after: float | None = None
+        # Whether the most recent navigation was already fed to the pacer as
+        # throttled, so a chrome-only page from it is not counted again.
+        self._navigation_throttled = False
+        # Held per extractor, and so per page: a new browser, which is also
+        # what a new login gets, starts with nothing cached.
+        self._profile_cache = ResultCache(
+            maxsize=_PROFILE_CACHE_SIZE, ttl=_PROFILE_CACHE_TTL
+        )
+        self._search_cache = ResultCache(
+            maxsize=_SEARCH_CACHE_SIZE, ttl=_SEARCH_CACHE_TTL
+        )
+
+    @property
+    def retry_after(self) -> float | None:
+        """``Retry-After`` of the most recent navigation, when it was throttled.
+
+        For callers that build a section's rate-limit error themselves; pass
+        it to ``rate_limited_section_error``.
+        """
+        return self._retry_after
+
+    def _record_soft_throttle(self) -> None:
+        """Feed a chrome-only page to the pacer, once per navigation.
+
+        A 429/503 navigation has already been recorded as throttled by
+        ``_goto_with_auth_checks``; counting its chrome-only page again would
+        double the delay twice for one throttle.
+        """
+        if not self._navigation_throttled:
+            _navigation_pacer.record_throttled()
+
+    def _rate_limit_retry_delay(self) -> float | None:
+        """Seconds to wait before retrying a soft-rate-limited page.
+
+        The fixed backoff, stretched to what the server asked for when the
+        last navigation carried a ``Retry-After``. None when that ask exceeds
+        ``_MAX_RATE_LIMIT_RETRY_DELAY``: retrying sooner than the server said
+        burns another request against the same limit for nothing.
+        """
+        hint = self._retry_after
+        if hint is None:
+            return _RATE_LIMIT_RETRY_DELAY
+        if hint > _MAX_RATE_LIMIT_RETRY_DELAY:
+            logger.info(
+                "Server asked for %.0fs before retrying; not retrying in this call",
+                hint,
+            )
+            return None
+        return max(_RATE_LIMIT_RETRY_DELAY, hint)
 
     @staticmethod
     def _normalize_body_marker(value: Any) -> str:
@@ -888,8 +1010,21 @@ class LinkedInExtractor:
                 "extractor-before-goto",
                 extra={"target_url": url, "wait_until": wait_until},
             )
+            paced = False
             try:
-                await self._page.goto(url, wait_until=wait_until, timeout=30000)
+                self._retry_after = None
+                self._navigation_throttled = False
+                started = time.monotonic()
+                response = await self._page.goto(
+                    url, wait_until=wait_until, timeout=30000
+                )
+                self._navigation_throttled = (
+                    getattr(response, "status", None) in _RETRY_AFTER_STATUSES
+                )
+                _navigation_pacer.record(
+                    time.monotonic() - started, ok=not self._navigation_throttled
+                )
+                paced = True
                 await stabilize_navigation(f"goto {url}", logger)
                 await record_page_trace(
                     self._page,
@@ -902,6 +1037,10 @@ class LinkedInExtractor:
                 # password in trace.jsonl. Converting here also keeps a proxy
                 # outage from being reported as a LinkedIn navigation problem.
                 raise_if_proxy_error(exc)
+                # A goto that failed or timed out is the clearest sign of a
+                # struggling LinkedIn there is, and the one most owed a backoff.
+                if not paced:
+                    _navigation_pacer.record(time.monotonic() - started, ok=False)
                 if allow_remember_me and await resolve_remember_me_prompt(self._page):
                     await stabilize_navigation(
                         f"remember-me resolution for {url}", logger
@@ -957,6 +1096,10 @@ class LinkedInExtractor:
                 # callers that branch on it are unaffected.
                 raise redacted_copy(exc) from None
 
+            # Outside the try above: a header that cannot be read is not a
+            # failed navigation.
+            self._retry_after = _retry_after_hint(response)
+
             barrier = await detect_auth_barrier_quick(self._page)
             if not barrier:
                 return
@@ -1306,9 +1449,9 @@ class LinkedInExtractor:
                     return
                 if not body:
                     return
-                text = body.decode("utf-8", errors="replace")
-                for match in _POST_SLUG_URL_RE.finditer(text):
-                    post_url = f"https://www.linkedin.com/posts/{match.group('slug')}"
+                for match in _POST_SLUG_URL_RE.finditer(body):
+                    slug = match.group("slug").decode("ascii")
+                    post_url = f"https://www.linkedin.com/posts/{slug}"
                     if post_url not in seen_urls:
                         seen_urls.add(post_url)
                         captured_urls.append(post_url)
@@ -1465,8 +1608,12 @@ class LinkedInExtractor:
                 return result
 
             # Retry once after backoff
-            logger.info("Retrying %s after %.0fs backoff", url, _RATE_LIMIT_RETRY_DELAY)
-            await asyncio.sleep(_RATE_LIMIT_RETRY_DELAY)
+            self._record_soft_throttle()
+            delay = self._rate_limit_retry_delay()
+            if delay is None:
+                return result
+            logger.info("Retrying %s after %.0fs backoff", url, delay)
+            await asyncio.sleep(delay)
             return await self._extract_page_once(url, section_name, max_scrolls)
 
         except LinkedInScraperException:
@@ -1602,10 +1749,12 @@ class LinkedInExtractor:
         # Click it until it disappears or the budget runs out.
         if is_details:
             max_clicks = max_scrolls if max_scrolls is not None else 5
+            # Locators are lazy and re-resolve on every call, so one built up
+            # front follows the button as each click re-renders the list.
+            button = self._page.locator("main button").filter(
+                has_text=_SHOW_MORE_BUTTON_TEXT
+            )
             for i in range(max_clicks):
-                button = self._page.locator("main button").filter(
-                    has_text=re.compile(r"^Show (more|all)\b", re.IGNORECASE)
-                )
                 try:
                     if await button.count() == 0:
                         logger.debug("No 'Show more' button after %d clicks", i)
@@ -1613,7 +1762,8 @@ class LinkedInExtractor:
                     target = button.first
                     if not await target.is_visible():
                         break
-                    await target.scroll_into_view_if_needed(timeout=2000)
+                    # click() scrolls the button into view itself as part of
+                    # its actionability checks.
                     await target.click(timeout=2000)
                     await asyncio.sleep(1.0)
                 except PlaywrightTimeoutError:
@@ -1667,12 +1817,12 @@ class LinkedInExtractor:
             if result.text != _RATE_LIMITED_MSG:
                 return result
 
-            logger.info(
-                "Retrying overlay %s after %.0fs backoff",
-                url,
-                _RATE_LIMIT_RETRY_DELAY,
-            )
-            await asyncio.sleep(_RATE_LIMIT_RETRY_DELAY)
+            self._record_soft_throttle()
+            delay = self._rate_limit_retry_delay()
+            if delay is None:
+                return result
+            logger.info("Retrying overlay %s after %.0fs backoff", url, delay)
+            await asyncio.sleep(delay)
             return await self._extract_overlay_once(url, section_name)
 
         except LinkedInScraperException:
@@ -1737,6 +1887,7 @@ class LinkedInExtractor:
         max_scrolls: int | None = None,
         *,
         main_profile_already_loaded: bool = False,
+        use_cache: bool = False,
     ) -> dict[str, Any]:
         """Scrape a person profile with configurable sections.
 
@@ -1747,10 +1898,25 @@ class LinkedInExtractor:
         soft-rate-limit sentinel (preserving the retry semantics of
         ``extract_page``).
 
+        With ``use_cache``, a complete result is kept for
+        ``_PROFILE_CACHE_TTL`` and a repeat of the same request is answered
+        from it without navigating. Results with section errors are never
+        kept, so a retry after throttling goes back to LinkedIn. Internal
+        callers leave it off: they read the loaded page afterwards, and a
+        cached answer would leave them reading some other page.
+
         Returns:
             {url, sections: {name: text}, profile_urn?: str}
         """
         requested = requested | {"main_profile"}
+        cache_key = (username, frozenset(requested), max_scrolls)
+        cached = self._profile_cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            logger.debug("Serving profile %s from cache", username)
+            if callbacks:
+                await callbacks.on_complete("person profile", cached)
+            return cached
+
         base_url = f"https://www.linkedin.com/in/{username}"
         sections: dict[str, str] = {}
         references: dict[str, list[Reference]] = {}
@@ -1771,7 +1937,7 @@ class LinkedInExtractor:
         try:
             for i, (section_name, suffix, is_overlay) in enumerate(requested_ordered):
                 if i > 0:
-                    await asyncio.sleep(_NAV_DELAY)
+                    await asyncio.sleep(_navigation_pacer.delay)
 
                 url = base_url + suffix
                 try:
@@ -1813,7 +1979,9 @@ class LinkedInExtractor:
                         if extracted.references:
                             references[section_name] = extracted.references
                     elif extracted.text == _RATE_LIMITED_MSG:
-                        section_errors[section_name] = rate_limited_section_error()
+                        section_errors[section_name] = rate_limited_section_error(
+                            self._retry_after
+                        )
                         # Stop rather than walk the remaining sections. Each one
                         # is another navigation, and LinkedIn has just said it
                         # wants fewer of them. Whatever was gathered before this
@@ -1869,6 +2037,8 @@ class LinkedInExtractor:
             result["references"] = references
         if section_errors:
             result["section_errors"] = section_errors
+        elif use_cache:
+            self._profile_cache.put(cache_key, result)
 
         if callbacks:
             await callbacks.on_complete("person profile", result)
@@ -2135,6 +2305,9 @@ class LinkedInExtractor:
         from linkedin_mcp_server.scraping.connection import detect_connection_state
 
         url = f"https://www.linkedin.com/in/{username}/"
+        # Whatever happens next may change the relationship state a cached
+        # copy of this profile shows.
+        self._profile_cache.invalidate(username)
 
         profile = await self.scrape_person(username, {"main_profile"})
         page_text = profile.get("sections", {}).get("main_profile", "")
@@ -2440,7 +2613,7 @@ class LinkedInExtractor:
                 continue
 
             if not first_show_all:
-                await asyncio.sleep(_NAV_DELAY)
+                await asyncio.sleep(_navigation_pacer.delay)
             first_show_all = False
 
             try:
@@ -2923,7 +3096,7 @@ class LinkedInExtractor:
         try:
             for i, (section_name, suffix, is_overlay) in enumerate(requested_ordered):
                 if i > 0:
-                    await asyncio.sleep(_NAV_DELAY)
+                    await asyncio.sleep(_navigation_pacer.delay)
 
                 url = base_url + suffix
                 try:
@@ -2941,7 +3114,9 @@ class LinkedInExtractor:
                         if extracted.references:
                             references[section_name] = extracted.references
                     elif extracted.text == _RATE_LIMITED_MSG:
-                        section_errors[section_name] = rate_limited_section_error()
+                        section_errors[section_name] = rate_limited_section_error(
+                            self._retry_after
+                        )
                         rate_limited = True
                     elif extracted.error:
                         section_errors[section_name] = extracted.error
@@ -3008,7 +3183,7 @@ class LinkedInExtractor:
             if extracted.references:
                 references["employees"] = extracted.references
         elif extracted.text == _RATE_LIMITED_MSG:
-            section_errors["employees"] = rate_limited_section_error()
+            section_errors["employees"] = rate_limited_section_error(self._retry_after)
         elif extracted.error:
             section_errors["employees"] = extracted.error
 
@@ -3039,7 +3214,9 @@ class LinkedInExtractor:
             if extracted.references:
                 references["job_posting"] = extracted.references
         elif extracted.text == _RATE_LIMITED_MSG:
-            section_errors["job_posting"] = rate_limited_section_error()
+            section_errors["job_posting"] = rate_limited_section_error(
+                self._retry_after
+            )
         elif extracted.error:
             section_errors["job_posting"] = extracted.error
 
@@ -3091,12 +3268,12 @@ class LinkedInExtractor:
             if result.text != _RATE_LIMITED_MSG:
                 return result
 
-            logger.info(
-                "Retrying search page %s after %.0fs backoff",
-                url,
-                _RATE_LIMIT_RETRY_DELAY,
-            )
-            await asyncio.sleep(_RATE_LIMIT_RETRY_DELAY)
+            self._record_soft_throttle()
+            delay = self._rate_limit_retry_delay()
+            if delay is None:
+                return result
+            logger.info("Retrying search page %s after %.0fs backoff", url, delay)
+            await asyncio.sleep(delay)
             result = await self._extract_search_page_once(url, section_name)
             if result.text == _RATE_LIMITED_MSG:
                 logger.warning("Search page %s still rate-limited after retry", url)
@@ -3235,12 +3412,15 @@ class LinkedInExtractor:
         work_type: str | None = None,
         easy_apply: bool = False,
         sort_by: str | None = None,
+        callbacks: ProgressCallback | None = None,
     ) -> dict[str, Any]:
         """Search for jobs with pagination and job ID extraction.
 
         Scrolls the job sidebar (not the main page) and paginates through
         results. Uses LinkedIn's "Page X of Y" indicator to cap pagination,
-        and stops early when a page yields no new job IDs.
+        and stops early when a page yields no new job IDs. Each page that
+        adds IDs is reported to *callbacks* as it lands, so a client sees
+        the search advance rather than waiting for every page.
 
         Args:
             keywords: Search keywords
@@ -3252,6 +3432,8 @@ class LinkedInExtractor:
             work_type: Filter by work type (on_site, remote, hybrid)
             easy_apply: Only show Easy Apply jobs
             sort_by: Sort results (date, relevance)
+            callbacks: Optional progress callbacks, told of the start and of
+                each loaded page
 
         Returns:
             {url, sections: {search_results: text}, job_ids: [str]}
@@ -3266,6 +3448,9 @@ class LinkedInExtractor:
             easy_apply=easy_apply,
             sort_by=sort_by,
         )
+        if callbacks:
+            await callbacks.on_start("job search", base_url)
+
         all_job_ids: list[str] = []
         seen_ids: set[str] = set()
         page_texts: list[str] = []
@@ -3281,7 +3466,7 @@ class LinkedInExtractor:
                 break
 
             if page_num > 0:
-                await asyncio.sleep(_NAV_DELAY)
+                await asyncio.sleep(_navigation_pacer.delay)
 
             url = (
                 base_url
@@ -3298,7 +3483,9 @@ class LinkedInExtractor:
                     # Rate limit first: it is the more specific diagnosis, and a
                     # page that was throttled may carry a generic error too.
                     if extracted.text == _RATE_LIMITED_MSG:
-                        section_errors["search_results"] = rate_limited_section_error()
+                        section_errors["search_results"] = rate_limited_section_error(
+                            self._retry_after
+                        )
                     elif extracted.error:
                         section_errors["search_results"] = extracted.error
                     # Navigation failed or rate-limited; skip ID extraction.
@@ -3347,7 +3534,17 @@ class LinkedInExtractor:
                 if extracted.references:
                     page_references.extend(extracted.references)
 
-            except LinkedInScraperException:
+                if callbacks:
+                    last_page = min(max_pages, total_pages or max_pages)
+                    await callbacks.on_progress(
+                        f"Loaded results page {page_num + 1}/{last_page} "
+                        f"({len(all_job_ids)} job IDs so far)",
+                        round((page_num + 1) / last_page * 95),
+                    )
+
+            except LinkedInScraperException as e:
+                if callbacks:
+                    await callbacks.on_error(e)
                 raise
             except Exception as e:
                 logger.warning("Error on search page %d: %s", page_num + 1, e)
@@ -3385,12 +3582,12 @@ class LinkedInExtractor:
             if result.text != _RATE_LIMITED_MSG:
                 return result
 
-            logger.info(
-                "Retrying saved jobs page %s after %.0fs backoff",
-                url,
-                _RATE_LIMIT_RETRY_DELAY,
-            )
-            await asyncio.sleep(_RATE_LIMIT_RETRY_DELAY)
+            self._record_soft_throttle()
+            delay = self._rate_limit_retry_delay()
+            if delay is None:
+                return result
+            logger.info("Retrying saved jobs page %s after %.0fs backoff", url, delay)
+            await asyncio.sleep(delay)
             result = await self._extract_saved_jobs_page_once(url, section_name)
             if result.text == _RATE_LIMITED_MSG:
                 logger.warning("Saved jobs page %s still rate-limited after retry", url)
@@ -3512,7 +3709,7 @@ class LinkedInExtractor:
                 break
 
             if page_num > 0:
-                await asyncio.sleep(_NAV_DELAY)
+                await asyncio.sleep(_navigation_pacer.delay)
 
             url = (
                 base_url
@@ -3527,7 +3724,9 @@ class LinkedInExtractor:
 
                 if not extracted.text or extracted.text == _RATE_LIMITED_MSG:
                     if extracted.text == _RATE_LIMITED_MSG:
-                        section_errors["saved_jobs"] = rate_limited_section_error()
+                        section_errors["saved_jobs"] = rate_limited_section_error(
+                            self._retry_after
+                        )
                     elif extracted.error:
                         section_errors["saved_jobs"] = extracted.error
                     break
@@ -3608,6 +3807,8 @@ class LinkedInExtractor:
         location: str | None = None,
         network: list[str] | None = None,
         current_company: str | None = None,
+        *,
+        use_cache: bool = False,
     ) -> dict[str, Any]:
         """Search for people and extract the results page.
 
@@ -3625,6 +3826,9 @@ class LinkedInExtractor:
                 unfiltered result set. Look up a company's URN via
                 ``get_company_profile`` -- it is exposed under
                 ``references["about"]``.
+            use_cache: Answer a repeat of the same search from the last
+                ``_SEARCH_CACHE_TTL`` seconds without navigating. Results with
+                section errors are never kept.
 
         Returns:
             {url, sections: {name: text}}
@@ -3654,6 +3858,10 @@ class LinkedInExtractor:
             params += f"&currentCompany={_encode_list_facet([current_company])}"
 
         url = f"https://www.linkedin.com/search/results/people/?{params}"
+        cached = self._search_cache.get((url,)) if use_cache else None
+        if cached is not None:
+            logger.debug("Serving search %s from cache", url)
+            return cached
         extracted = await self.extract_page(url, section_name="search_results")
 
         sections: dict[str, str] = {}
@@ -3664,7 +3872,9 @@ class LinkedInExtractor:
             if extracted.references:
                 references["search_results"] = extracted.references
         elif extracted.text == _RATE_LIMITED_MSG:
-            section_errors["search_results"] = rate_limited_section_error()
+            section_errors["search_results"] = rate_limited_section_error(
+                self._retry_after
+            )
         elif extracted.error:
             section_errors["search_results"] = extracted.error
 
@@ -3676,18 +3886,28 @@ class LinkedInExtractor:
             result["references"] = references
         if section_errors:
             result["section_errors"] = section_errors
+        elif use_cache:
+            self._search_cache.put((url,), result)
         return result
 
     async def search_companies(
         self,
         keywords: str,
+        *,
+        use_cache: bool = False,
     ) -> dict[str, Any]:
         """Search for companies and extract the results page.
 
+        ``use_cache`` behaves as it does for :meth:`search_people`.
+
         Returns:
             {url, sections: {search_results: text}}
         """
         url = f"https://www.linkedin.com/search/results/companies/?keywords={quote_plus(keywords)}"
+        cached = self._search_cache.get((url,)) if use_cache else None
+        if cached is not None:
+            logger.debug("Serving search %s from cache", url)
+            return cached
         extracted = await self.extract_page(url, section_name="search_results")
 
         sections: dict[str, str] = {}
@@ -3698,7 +3918,9 @@ class LinkedInExtractor:
             if extracted.references:
                 references["search_results"] = extracted.references
         elif extracted.text == _RATE_LIMITED_MSG:
-            section_errors["search_results"] = rate_limited_section_error()
+            section_errors["search_results"] = rate_limited_section_error(
+                self._retry_after
+            )
         elif extracted.error:
             section_errors["search_results"] = extracted.error
 
@@ -3710,6 +3932,8 @@ class LinkedInExtractor:
             result["references"] = references
         if section_errors:
             result["section_errors"] = section_errors
+        elif use_cache:
+            self._search_cache.put((url,), result)
         return result
 
     @staticmethod
@@ -3795,10 +4019,9 @@ class LinkedInExtractor:
             if extracted.references:
                 references["search_results"] = extracted.references
         elif extracted.text == _RATE_LIMITED_MSG:
-            section_errors["search_results"] = {
-                "error_type": "rate_limit",
-                "error_message": extracted.text,
-            }
+            section_errors["search_results"] = rate_limited_section_error(
+                self._retry_after
+            )
         elif extracted.error:
             section_errors["search_results"] = extracted.error
 
@@ -4368,6 +4591,26 @@ class LinkedInExtractor:
                     return '';
                 };
 
+                // Only redirect and people-search links carry a query that
+                // classify_link reads; every other query is tracking it drops,
+                // so strip it here rather than ship it across CDP.
+                const compactHref = href => {
+                    let url;
+                    try {
+                        url = new URL(href);
+                    } catch {
+                        return href;
+                    }
+                    if (
+                        !['http:', 'https:'].includes(url.protocol) ||
+                        url.pathname === '/redir/redirect/' ||
+                        url.pathname.replace(/\\/$/, '') === '/search/results/people'
+                    ) {
+                        return href;
+                    }
+                    return url.origin + url.pathname;
+                };
+
                 const references = Array.from(container.querySelectorAll('a[href]'))
                     .slice(0, MAX_REFERENCE_ANCHORS)
                     .map(anchor => {
@@ -4378,7 +4621,7 @@ class LinkedInExtractor:
 
                         const href = rawHref.startsWith('#')
                             ? rawHref
-                            : (anchor.href || rawHref);
+                            : compactHref(anchor.href || rawHref);
 
                         return {
                             href,
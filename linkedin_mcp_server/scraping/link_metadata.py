@@ -128,6 +128,19 @@ _NEWSLETTER_PATH_RE = re.compile(r"^/newsletters/([^/?#]+)")
 _PULSE_PATH_RE = re.compile(r"^/pulse/([^/?#]+)")
 _FEED_PATH_RE = re.compile(r"^/feed/update/([^/?#]+)")
 _MESSAGING_THREAD_PATH_RE = re.compile(r"^/messaging/thread/([^/?#]+)")
+# Every path the regexes above can match starts with one of these. Most
+# anchors on a page match none of them, and one ``startswith`` turns those
+# away before the regexes are tried one after another.
+_CLASSIFIED_PATH_PREFIXES = (
+    "/in/",
+    "/company/",
+    "/school/",
+    "/jobs/view/",
+    "/newsletters/",
+    "/pulse/",
+    "/feed/update/",
+    "/messaging/thread/",
+)
 _MAX_REDIRECT_UNWRAP_DEPTH = 5
 
 # Accept both quoted-string and bare-integer JSON list elements, e.g.
@@ -272,7 +285,7 @@ def classify_link(href: str) -> tuple[ReferenceKind, str] | None:
                 f"/search/results/people/?currentCompany=%5B%22{urn_id}%22%5D",
             )
 
-    if _is_linkedin_chrome(path):
+    if not path.startswith(_CLASSIFIED_PATH_PREFIXES) or _is_linkedin_chrome(path):
         return None
 
     if match := _PERSON_PATH_RE.match(path):
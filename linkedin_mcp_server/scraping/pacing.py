@@ -0,0 +1,91 @@
+"""Adaptive pacing between LinkedIn page navigations.
+
+A fixed pause between navigations is wrong in both directions: too long while
+LinkedIn answers promptly, and too short once it starts throttling. The pacer
+here tunes the pause the way TCP tunes its window, inverted because it governs
+a delay rather than a rate: a small additive step down after each quick,
+healthy navigation, and a multiplicative step up on any sign of throttling.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class NavigationPacer:
+    """AIMD-tuned delay between consecutive page navigations.
+
+    Samples are ``(latency, ok)`` pairs over a sliding window. The delay only
+    shrinks while every sample in the window is healthy and their average
+    latency is at or under *target_latency*: a slow LinkedIn is often a
+    LinkedIn about to throttle, so slowness alone holds the delay where it is.
+    One throttled navigation multiplies the delay by *backoff_factor*.
+
+    The floor is deliberately not zero. Pacing exists to look like a person
+    reading pages, not only to stay under a rate limit, and no measured
+    success makes a burst of back-to-back navigations look human.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: float,
+        floor: float,
+        ceiling: float,
+        step: float = 0.25,
+        backoff_factor: float = 2.0,
+        target_latency: float = 3.0,
+        window: int = 8,
+    ) -> None:
+        if not 0 < floor <= initial <= ceiling:
+            raise ValueError(
+                "Pacing bounds must satisfy 0 < floor <= initial <= ceiling"
+            )
+        self._initial = initial
+        self._floor = floor
+        self._ceiling = ceiling
+        self._step = step
+        self._backoff_factor = backoff_factor
+        self._target_latency = target_latency
+        self._samples: deque[tuple[float, bool]] = deque(maxlen=window)
+        self._delay = initial
+
+    @property
+    def delay(self) -> float:
+        """Seconds to pause before the next navigation."""
+        return self._delay
+
+    def record(self, latency: float, *, ok: bool) -> None:
+        """Feed one navigation outcome into the controller."""
+        self._samples.append((latency, ok))
+        if not ok:
+            self._increase()
+            return
+        if not all(sample_ok for _, sample_ok in self._samples):
+            return
+        average = sum(sample for sample, _ in self._samples) / len(self._samples)
+        if average <= self._target_latency:
+            self._delay = max(self._floor, self._delay - self._step)
+
+    def record_throttled(self) -> None:
+        """Note a page that loaded but came back throttled."""
+        self._samples.append((0.0, False))
+        self._increase()
+
+    def reset(self) -> None:
+        """Forget every sample and return to the initial delay."""
+        self._samples.clear()
+        self._delay = self._initial
+
+    def _increase(self) -> None:
+        previous = self._delay
+        self._delay = min(self._ceiling, self._delay * self._backoff_factor)
+        if self._delay != previous:
+            logger.info(
+                "Throttling observed; navigation delay raised %.2fs -> %.2fs",
+                previous,
+                self._delay,
+            )
@@ -0,0 +1,65 @@
+"""Short-lived cache of scraped results.
+
+A client working through one person or one search tends to ask for the same
+page again within minutes, and those pages rarely change in that time.
+Answering the repeat from memory spares LinkedIn a navigation per section,
+which counts toward its rate limits as much as it costs wall-clock time.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+import copy
+import logging
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[Hashable, ...]
+
+
+class ResultCache:
+    """LRU of tool results that expire *ttl* seconds after being stored.
+
+    Keys are tuples whose first element names what was scraped, e.g.
+    ``(username, sections, max_scrolls)`` for a profile. Results are copied on
+    the way in and out, because callers add keys to the dict they get back.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        if maxsize < 1 or ttl <= 0:
+            raise ValueError("Result cache needs maxsize >= 1 and ttl > 0")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[CacheKey, tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+
+    def get(self, key: CacheKey) -> dict[str, Any] | None:
+        """Return a copy of the stored result, or None when absent or stale."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def put(self, key: CacheKey, result: dict[str, Any]) -> None:
+        """Store a copy of *result*, evicting the least recently used entry."""
+        self._entries[key] = (time.monotonic() + self._ttl, copy.deepcopy(result))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, head: Hashable) -> None:
+        """Drop every entry whose key starts with *head*, e.g. a username."""
+        stale = [key for key in self._entries if key[0] == head]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            logger.debug("Dropped %d cached result(s) for %s", len(stale), head)
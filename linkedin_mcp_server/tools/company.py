@@ -142,7 +142,9 @@ def register_company_tools(
                 if extracted.references:
                     references["posts"] = extracted.references
             elif extracted.text == _RATE_LIMITED_MSG:
-                section_errors["posts"] = rate_limited_section_error()
+                section_errors["posts"] = rate_limited_section_error(
+                    extractor.retry_after
+                )
             elif extracted.error:
                 section_errors["posts"] = extracted.error
 
@@ -199,7 +201,7 @@ def register_company_tools(
                 progress=0, total=100, message="Starting company search"
             )
 
-            result = await extractor.search_companies(keywords)
+            result = await extractor.search_companies(keywords, use_cache=True)
 
             await ctx.report_progress(progress=100, total=100, message="Complete")
 
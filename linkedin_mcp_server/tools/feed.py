@@ -88,7 +88,9 @@ def register_feed_tools(
                 if extracted.references:
                     references["feed"] = extracted.references
             elif extracted.text == _RATE_LIMITED_MSG:
-                section_errors["feed"] = rate_limited_section_error()
+                section_errors["feed"] = rate_limited_section_error(
+                    extractor.retry_after
+                )
             elif extracted.error:
                 section_errors["feed"] = extracted.error
 
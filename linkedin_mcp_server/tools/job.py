@@ -10,6 +10,7 @@ from typing import Annotated, Any
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
+from linkedin_mcp_server.callbacks import MCPContextProgressCallback
 from linkedin_mcp_server.config.schema import DEFAULT_TOOL_TIMEOUT_SECONDS
 from linkedin_mcp_server.core.exceptions import AuthenticationError
 from linkedin_mcp_server.dependencies import get_ready_extractor, handle_auth_error
@@ -122,10 +123,7 @@ def register_job_tools(
                 max_pages,
             )
 
-            await ctx.report_progress(
-                progress=0, total=100, message="Starting job search"
-            )
-
+            cb = MCPContextProgressCallback(ctx)
             result = await extractor.search_jobs(
                 keywords,
                 location=location,
@@ -136,9 +134,10 @@ def register_job_tools(
                 work_type=work_type,
                 easy_apply=easy_apply,
                 sort_by=sort_by,
+                callbacks=cb,
             )
 
-            await ctx.report_progress(progress=100, total=100, message="Complete")
+            await cb.on_complete("job search", result)
 
             return result
 
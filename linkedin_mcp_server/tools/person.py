@@ -86,6 +86,7 @@ def register_person_tools(
                 requested,
                 callbacks=cb,
                 max_scrolls=max_scrolls,
+                use_cache=True,
             )
 
             if unknown:
@@ -161,6 +162,7 @@ def register_person_tools(
                     location,
                     network=network,
                     current_company=current_company,
+                    use_cache=True,
                 )
             except FilterValidationError as e:
                 # Validation messages carry actionable detail; surface
@@ -7,8 +7,12 @@ def reset_singletons():
     from linkedin_mcp_server.bootstrap import reset_bootstrap_for_testing
     from linkedin_mcp_server.config import reset_config
     from linkedin_mcp_server.daemon_liveness import reset_liveness_for_testing
+    from linkedin_mcp_server.dependencies import reset_extractor_for_testing
     from linkedin_mcp_server.drivers.browser import reset_browser_for_testing
     from linkedin_mcp_server.profile_lease import reset_leases_for_testing
+    from linkedin_mcp_server.scraping.extractor import (
+        reset_navigation_pacing_for_testing,
+    )
     from linkedin_mcp_server.server_role import reset_process_role_for_testing
 
     reset_bootstrap_for_testing()
@@ -19,8 +23,14 @@ def reset_singletons():
     # owner that was not running.
     reset_liveness_for_testing()
     reset_browser_for_testing()
+    # The extractor is cached per page, and its profile and search caches with
+    # it; a page mock one test reuses would otherwise serve another's results.
+    reset_extractor_for_testing()
     reset_leases_for_testing()
     reset_config()
+    # The pacer learns from every navigation, and a throttle one test simulates
+    # would otherwise stretch the pauses of every test after it.
+    reset_navigation_pacing_for_testing()
     # Every test that builds a server records a role, and the auth gates read it
     # from process state. Left standing, one OWNER would refuse logins in every
     # test after it, in a suite where most never mention a role.
@@ -28,6 +38,7 @@ def reset_singletons():
     yield
     reset_bootstrap_for_testing()
     reset_browser_for_testing()
+    reset_extractor_for_testing()
     # After the browser, so a lease the browser still held is released by its
     # own bookkeeping first rather than yanked out from under it.
     reset_leases_for_testing()
@@ -939,3 +939,24 @@ def test_live_macos_keychain_throwaway_item(tmp_path):
             ["security", "delete-generic-password", "-s", service],
             capture_output=True,
         )
+
+
+def test_validating_config_does_not_import_extract():
+    # The package resolves extract's names lazily so that config validation,
+    # which reaches browser_import for the list of supported browsers, does not
+    # pay for the cookie-decryption imports on every start.
+    probe = (
+        "from linkedin_mcp_server.config.schema import ServerConfig;"
+        "import sys;"
+        "ServerConfig(import_from_browser='auto').validate();"
+        "print('linkedin_mcp_server.browser_import.discovery' in sys.modules"
+        " and 'linkedin_mcp_server.browser_import.extract' not in sys.modules)"
+    )
+    answered = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+    assert answered == "True"
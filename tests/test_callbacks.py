@@ -0,0 +1,44 @@
+"""Tests for MCP progress callbacks."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from linkedin_mcp_server.callbacks import MCPContextProgressCallback
+
+
+def _sent(ctx: MagicMock) -> list[tuple[int, str]]:
+    return [
+        (call.kwargs["progress"], call.kwargs["message"])
+        for call in ctx.report_progress.await_args_list
+    ]
+
+
+class TestMCPContextProgressCallback:
+    async def test_every_report_is_sent_in_order(self):
+        ctx = MagicMock()
+        ctx.report_progress = AsyncMock()
+        cb = MCPContextProgressCallback(ctx)
+
+        await cb.on_start("person profile", "https://www.linkedin.com/in/x")
+        await cb.on_progress("Scraped main_profile (1/3)", 31)
+        await cb.on_progress("Scraped experience (2/3)", 63)
+        await cb.on_progress("Scraped education (3/3)", 95)
+        await cb.on_complete("person profile", {})
+
+        assert _sent(ctx) == [
+            (0, "Starting person profile"),
+            (31, "Scraped main_profile (1/3)"),
+            (63, "Scraped experience (2/3)"),
+            (95, "Scraped education (3/3)"),
+            (100, "Complete"),
+        ]
+
+    async def test_progress_is_sent_before_the_call_returns(self):
+        ctx = MagicMock()
+        ctx.report_progress = AsyncMock()
+        cb = MCPContextProgressCallback(ctx)
+
+        await cb.on_progress("Scraped about (1/2)", 47)
+        assert _sent(ctx) == [(47, "Scraped about (1/2)")]
+
+        await cb.on_error(RuntimeError("boom"))
+        assert _sent(ctx) == [(47, "Scraped about (1/2)"), (0, "Error: boom")]
@@ -1,11 +1,17 @@
 """Tests for core utility functions (rate-limit detection, scrolling, modals)."""
 
-from unittest.mock import AsyncMock, MagicMock
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from linkedin_mcp_server.core.exceptions import RateLimitError
-from linkedin_mcp_server.core.utils import detect_rate_limit
+from linkedin_mcp_server.core.utils import (
+    detect_rate_limit,
+    parse_retry_after,
+    scroll_to_bottom,
+)
 
 
 @pytest.fixture
@@ -109,3 +115,41 @@ class TestDetectRateLimit:
 
         mock_page.locator = MagicMock(side_effect=locator_side_effect)
         await detect_rate_limit(mock_page)
+
+
+class TestScrollToBottom:
+    async def test_two_round_trips_per_scroll_until_height_settles(self):
+        page = MagicMock()
+        # Scroll-and-read, then read, per pass: grows once, then settles.
+        page.evaluate = AsyncMock(side_effect=[1000, 1800, 1800, 1800])
+
+        with patch(
+            "linkedin_mcp_server.core.utils.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            await scroll_to_bottom(page)
+
+        assert page.evaluate.await_count == 4
+        # One full default pause per pass.
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [1.0, 1.0]
+
+
+class TestParseRetryAfter:
+    def test_delta_seconds(self):
+        assert parse_retry_after("120") == 120.0
+
+    def test_surrounding_whitespace_is_ignored(self):
+        assert parse_retry_after(" 7 ") == 7.0
+
+    def test_http_date_in_the_future(self):
+        when = datetime.now(UTC) + timedelta(seconds=90)
+        seconds = parse_retry_after(format_datetime(when, usegmt=True))
+        assert seconds is not None
+        assert 80 <= seconds <= 90
+
+    def test_http_date_in_the_past_reads_as_zero(self):
+        when = datetime.now(UTC) - timedelta(hours=1)
+        assert parse_retry_after(format_datetime(when, usegmt=True)) == 0.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon", "-5", "1.5", 30, "²", "٣٠"])
+    def test_unparseable_values_return_none(self, value):
+        assert parse_retry_after(value) is None
@@ -99,6 +99,62 @@ class TestGetReadyExtractor:
             mock_get_browser.assert_awaited_once()
             mock_ensure_auth.assert_awaited_once()
 
+    async def test_extractor_is_reused_for_the_same_page(self):
+        first_browser = MagicMock()
+        second_browser = MagicMock()
+        with (
+            patch(
+                "linkedin_mcp_server.dependencies.ensure_tool_ready_or_raise",
+                new_callable=AsyncMock,
+            ),
+            patch(
+                "linkedin_mcp_server.dependencies.get_or_create_browser",
+                new_callable=AsyncMock,
+                side_effect=[first_browser, first_browser, second_browser],
+            ),
+            patch(
+                "linkedin_mcp_server.dependencies.ensure_authenticated",
+                new_callable=AsyncMock,
+            ),
+        ):
+            first = await get_ready_extractor(ctx=None, tool_name="test_tool")
+            again = await get_ready_extractor(ctx=None, tool_name="test_tool")
+            relaunched = await get_ready_extractor(ctx=None, tool_name="test_tool")
+
+        assert again is first
+        # A new browser means a new page, and the extractor follows it.
+        assert relaunched is not first
+        assert relaunched._page is second_browser.page
+
+    async def test_closing_the_browser_drops_the_extractor(self, monkeypatch):
+        import linkedin_mcp_server.drivers.browser as browser_module
+
+        browser = MagicMock()
+        browser.close = AsyncMock(return_value=True)
+        with (
+            patch(
+                "linkedin_mcp_server.dependencies.ensure_tool_ready_or_raise",
+                new_callable=AsyncMock,
+            ),
+            patch(
+                "linkedin_mcp_server.dependencies.get_or_create_browser",
+                new_callable=AsyncMock,
+                return_value=browser,
+            ),
+            patch(
+                "linkedin_mcp_server.dependencies.ensure_authenticated",
+                new_callable=AsyncMock,
+            ),
+        ):
+            first = await get_ready_extractor(ctx=None, tool_name="test_tool")
+            monkeypatch.setattr(browser_module, "_browser", browser)
+            await browser_module.close_browser()
+            after_close = await get_ready_extractor(ctx=None, tool_name="test_tool")
+
+        # Same page object, but the close let go of the old extractor and the
+        # results it had cached.
+        assert after_close is not first
+
     async def test_auth_error_triggers_relogin(self):
         """AuthenticationError from ensure_authenticated triggers relogin."""
         with (
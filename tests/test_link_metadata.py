@@ -2,6 +2,8 @@
 
 from urllib.parse import quote
 
+import pytest
+
 from linkedin_mcp_server.scraping.link_metadata import (
     RawReference,
     build_references,
@@ -729,6 +731,18 @@ class TestClassifyLink:
         )
         assert result == ("conversation", "/messaging/thread/2-abc123/")
 
+    @pytest.mark.parametrize(
+        "href",
+        [
+            "https://www.linkedin.com/groups/12345/",
+            "https://www.linkedin.com/in",
+            "https://www.linkedin.com/jobs/search/?keywords=python",
+            "https://www.linkedin.com/",
+        ],
+    )
+    def test_unrecognised_linkedin_paths_are_dropped(self, href):
+        assert classify_link(href) is None
+
     def test_inbox_references_include_threads(self):
         references = build_references(
             [
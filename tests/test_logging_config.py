@@ -1,7 +1,11 @@
 import logging
 
 from linkedin_mcp_server.debug_trace import get_trace_dir, reset_trace_state_for_testing
-from linkedin_mcp_server.logging_config import configure_logging, teardown_trace_logging
+from linkedin_mcp_server.logging_config import (
+    CompactFormatter,
+    configure_logging,
+    teardown_trace_logging,
+)
 
 
 def setup_function():
@@ -60,3 +64,20 @@ def test_registered_trace_cleanup_removes_ephemeral_trace_dir(monkeypatch, tmp_p
         for handler in logging.getLogger().handlers
         if isinstance(handler, logging.FileHandler)
     )
+
+
+def test_compact_formatter_shortens_name_without_touching_record():
+    record = logging.LogRecord(
+        "linkedin_mcp_server.scraping.extractor",
+        logging.INFO,
+        __file__,
+        1,
+        "Scraped %s",
+        ("main_profile",),
+        None,
+    )
+
+    line = CompactFormatter().format(record)
+
+    assert line.endswith(" - scraping.extractor - INFO - Scraped main_profile")
+    assert record.name == "linkedin_mcp_server.scraping.extractor"
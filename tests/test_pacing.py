@@ -0,0 +1,61 @@
+"""Tests for the adaptive navigation pacer."""
+
+import pytest
+
+from linkedin_mcp_server.scraping.pacing import NavigationPacer
+
+
+def make_pacer(**overrides) -> NavigationPacer:
+    options = {"initial": 2.0, "floor": 1.0, "ceiling": 8.0, "window": 3}
+    options.update(overrides)
+    return NavigationPacer(**options)
+
+
+class TestNavigationPacer:
+    def test_starts_at_initial_delay(self):
+        assert make_pacer().delay == 2.0
+
+    def test_fast_healthy_navigations_shrink_the_delay_additively(self):
+        pacer = make_pacer()
+        pacer.record(0.5, ok=True)
+        pacer.record(0.5, ok=True)
+        assert pacer.delay == pytest.approx(1.5)
+
+    def test_delay_never_drops_below_the_floor(self):
+        pacer = make_pacer()
+        for _ in range(20):
+            pacer.record(0.1, ok=True)
+        assert pacer.delay == 1.0
+
+    def test_slow_navigations_hold_the_delay(self):
+        pacer = make_pacer(target_latency=3.0)
+        pacer.record(5.0, ok=True)
+        assert pacer.delay == 2.0
+
+    def test_failure_doubles_the_delay_up_to_the_ceiling(self):
+        pacer = make_pacer()
+        pacer.record(0.5, ok=False)
+        assert pacer.delay == 4.0
+        pacer.record_throttled()
+        pacer.record_throttled()
+        assert pacer.delay == 8.0
+
+    def test_recent_failure_in_window_blocks_decrease(self):
+        pacer = make_pacer()
+        pacer.record_throttled()
+        pacer.record(0.1, ok=True)
+        pacer.record(0.1, ok=True)
+        assert pacer.delay == 4.0
+        # The failure ages out of the three-sample window.
+        pacer.record(0.1, ok=True)
+        assert pacer.delay == pytest.approx(3.75)
+
+    def test_reset_restores_initial_delay(self):
+        pacer = make_pacer()
+        pacer.record_throttled()
+        pacer.reset()
+        assert pacer.delay == 2.0
+
+    def test_rejects_inconsistent_bounds(self):
+        with pytest.raises(ValueError):
+            NavigationPacer(initial=0.5, floor=1.0, ceiling=8.0)
@@ -0,0 +1,69 @@
+"""Tests for the short-lived result cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from linkedin_mcp_server.scraping.result_cache import ResultCache
+
+
+def key(username: str = "alice", *sections: str):
+    return (username, frozenset({"main_profile", *sections}), None)
+
+
+class TestResultCache:
+    def test_returns_a_copy_of_what_was_stored(self):
+        cache = ResultCache(maxsize=4, ttl=60)
+        result = {"url": "https://www.linkedin.com/in/alice/", "sections": {}}
+        cache.put(key(), result)
+
+        hit = cache.get(key())
+        assert hit == result
+        hit["unknown_sections"] = ["bogus"]
+        assert cache.get(key()) == result
+
+    def test_sections_are_part_of_the_key(self):
+        cache = ResultCache(maxsize=4, ttl=60)
+        cache.put(key("alice", "experience"), {"sections": {}})
+
+        assert cache.get(key("alice")) is None
+
+    def test_entries_expire(self):
+        cache = ResultCache(maxsize=4, ttl=60)
+        clock = "linkedin_mcp_server.scraping.result_cache.time.monotonic"
+        with patch(clock, return_value=1000.0):
+            cache.put(key(), {"sections": {}})
+        with patch(clock, return_value=1059.0):
+            assert cache.get(key()) is not None
+        with patch(clock, return_value=1060.0):
+            assert cache.get(key()) is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ResultCache(maxsize=2, ttl=60)
+        cache.put(key("alice"), {"sections": {}})
+        cache.put(key("bob"), {"sections": {}})
+        cache.get(key("alice"))
+        cache.put(key("carol"), {"sections": {}})
+
+        assert cache.get(key("alice")) is not None
+        assert cache.get(key("bob")) is None
+        assert cache.get(key("carol")) is not None
+
+    def test_invalidate_drops_every_entry_for_a_username(self):
+        cache = ResultCache(maxsize=4, ttl=60)
+        cache.put(key("alice"), {"sections": {}})
+        cache.put(key("alice", "experience"), {"sections": {}})
+        cache.put(key("bob"), {"sections": {}})
+
+        cache.invalidate("alice")
+
+        assert cache.get(key("alice")) is None
+        assert cache.get(key("alice", "experience")) is None
+        assert cache.get(key("bob")) is not None
+
+    @pytest.mark.parametrize(
+        "options", [{"maxsize": 0, "ttl": 60}, {"maxsize": 1, "ttl": 0}]
+    )
+    def test_rejects_degenerate_bounds(self, options):
+        with pytest.raises(ValueError):
+            ResultCache(**options)
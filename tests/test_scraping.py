@@ -1,6 +1,6 @@
 """Tests for the LinkedInExtractor scraping engine."""
 
-from unittest.mock import ANY, AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
 
@@ -20,6 +20,7 @@ from linkedin_mcp_server.scraping.extractor import (
     _CONTENT_DATE_POSTED_MAP,
     _RATE_LIMITED_MSG,
     _build_feed_references,
+    _navigation_pacer,
     _truncate_linkedin_noise,
     strip_conversation_chrome,
     strip_linkedin_noise,
@@ -224,6 +225,8 @@ class TestExtractPage:
         assert result.text == ""
         assert result.references == []
         assert result.error == {"issue_template_path": "/tmp/issue.md"}
+        # A failed goto backs the shared pacer off like a throttled one.
+        assert _navigation_pacer.delay == 4.0
 
     async def test_extract_page_raises_auth_error_for_account_picker(self, mock_page):
         mock_page.goto = AsyncMock(side_effect=Exception("net::ERR_TOO_MANY_REDIRECTS"))
@@ -345,6 +348,92 @@ class TestExtractPage:
 
         assert result.text == "Education\nHarvard University\n1973 – 1975"
 
+    @pytest.mark.parametrize(
+        ("retry_after", "expected_sleeps", "expected_gotos", "expected_delay"),
+        [
+            # A hint longer than the fixed backoff stretches the wait.
+            ("12", [12.0], 2, 8.0),
+            # A shorter one does not shorten it below the fixed backoff.
+            ("1", [5.0], 2, 8.0),
+            # One longer than the in-call cap skips the retry entirely.
+            ("600", [], 1, 4.0),
+        ],
+    )
+    async def test_retry_honours_retry_after_header(
+        self, mock_page, retry_after, expected_sleeps, expected_gotos, expected_delay
+    ):
+        noise_only = "More profiles for you\n\nAbout\nAccessibility\nTalent Solutions"
+        mock_page.evaluate = AsyncMock(
+            return_value={"source": "root", "text": noise_only, "references": []}
+        )
+        response = MagicMock(status=429, headers={"retry-after": retry_after})
+        mock_page.goto = AsyncMock(return_value=response)
+        extractor = LinkedInExtractor(mock_page)
+        sleep = AsyncMock()
+        with (
+            patch(
+                "linkedin_mcp_server.scraping.extractor.scroll_to_bottom",
+                new_callable=AsyncMock,
+            ),
+            patch(
+                "linkedin_mcp_server.scraping.extractor.detect_rate_limit",
+                new_callable=AsyncMock,
+            ),
+            patch(
+                "linkedin_mcp_server.scraping.extractor.handle_modal_close",
+                new_callable=AsyncMock,
+                return_value=False,
+            ),
+            patch("linkedin_mcp_server.scraping.extractor.asyncio.sleep", sleep),
+        ):
+            result = await extractor.extract_page(
+                "https://www.linkedin.com/in/testuser/details/experience/",
+                section_name="experience",
+            )
+
+        assert result.text == _RATE_LIMITED_MSG
+        assert [c.args[0] for c in sleep.await_args_list] == expected_sleeps
+        assert mock_page.goto.await_count == expected_gotos
+        # Each throttled navigation doubles the shared delay once, from 2s,
+        # however many signs of throttling its page showed.
+        assert _navigation_pacer.delay == expected_delay
+
+    async def test_retry_after_ignored_on_successful_response(self, mock_page):
+        response = MagicMock(status=200, headers={"retry-after": "600"})
+        mock_page.goto = AsyncMock(return_value=response)
+        extractor = LinkedInExtractor(mock_page)
+
+        await extractor._goto_with_auth_checks("https://www.linkedin.com/in/x/")
+
+        assert extractor._retry_after is None
+
+    async def test_unreadable_retry_after_is_not_a_navigation_failure(self, mock_page):
+        response = MagicMock(status=429)
+        type(response).headers = PropertyMock(side_effect=RuntimeError("gone"))
+        mock_page.goto = AsyncMock(return_value=response)
+        extractor = LinkedInExtractor(mock_page)
+
+        with (
+            patch.object(
+                extractor, "_log_navigation_failure", new_callable=AsyncMock
+            ) as log_failure,
+            pytest.raises(RuntimeError, match="gone"),
+        ):
+            await extractor._goto_with_auth_checks("https://www.linkedin.com/in/x/")
+
+        log_failure.assert_not_awaited()
+        # Recorded once, for the 429 itself, not again as a failed goto.
+        assert _navigation_pacer.delay == 4.0
+
+    async def test_healthy_navigations_never_pace_below_the_baseline(self, mock_page):
+        mock_page.goto = AsyncMock(return_value=MagicMock(status=200, headers={}))
+        extractor = LinkedInExtractor(mock_page)
+
+        for _ in range(10):
+            await extractor._goto_with_auth_checks("https://www.linkedin.com/in/x/")
+
+        assert _navigation_pacer.delay == 2.0
+
     async def test_media_only_controls_are_not_misclassified_as_rate_limited(
         self, mock_page
     ):
@@ -2175,6 +2264,20 @@ class TestScrapeJob:
         assert result["sections"] == {}
         assert result["section_errors"]["job_posting"]["error_type"] == "rate_limit"
 
+    async def test_scrape_job_passes_on_retry_after(self, mock_page):
+        extractor = LinkedInExtractor(mock_page)
+        extractor._retry_after = 600.0
+        with patch.object(
+            extractor,
+            "extract_page",
+            new_callable=AsyncMock,
+            return_value=extracted(_RATE_LIMITED_MSG),
+        ):
+            result = await extractor.scrape_job("12345")
+
+        error = result["section_errors"]["job_posting"]
+        assert error["retry_after_seconds"] == 600
+
     async def test_scrape_job_omits_orphaned_references_when_text_empty(
         self, mock_page
     ):
@@ -2233,6 +2336,82 @@ class TestSearchJobs:
         assert result["job_ids"] == ["111", "222", "333"]
         assert "search_results" in result["sections"]
 
+    async def test_reports_each_loaded_page(self, mock_page):
+        extractor = LinkedInExtractor(mock_page)
+        callbacks = MagicMock()
+        callbacks.on_start = AsyncMock()
+        callbacks.on_progress = AsyncMock()
+        with (
+            patch.object(
+                extractor,
+                "_extract_search_page",
+                new_callable=AsyncMock,
+                return_value=extracted("Jobs"),
+            ),
+            patch.object(
+                extractor,
+                "_extract_job_ids",
+                new_callable=AsyncMock,
+                side_effect=[["111", "222"], ["333"]],
+            ),
+            patch.object(
+                extractor,
+                "_get_total_search_pages",
+                new_callable=AsyncMock,
+                return_value=2,
+            ),
+            patch(
+                "linkedin_mcp_server.scraping.extractor.asyncio.sleep",
+                new_callable=AsyncMock,
+            ),
+        ):
+            await extractor.search_jobs("python", max_pages=5, callbacks=callbacks)
+
+        callbacks.on_start.assert_awaited_once_with(
+            "job search", "https://www.linkedin.com/jobs/search/?keywords=python"
+        )
+        assert [c.args for c in callbacks.on_progress.await_args_list] == [
+            ("Loaded results page 1/2 (2 job IDs so far)", 48),
+            ("Loaded results page 2/2 (3 job IDs so far)", 95),
+        ]
+
+    async def test_reports_error_when_a_later_page_raises(self, mock_page):
+        extractor = LinkedInExtractor(mock_page)
+        callbacks = MagicMock()
+        callbacks.on_start = AsyncMock()
+        callbacks.on_progress = AsyncMock()
+        callbacks.on_error = AsyncMock()
+        with (
+            patch.object(
+                extractor,
+                "_extract_search_page",
+                new_callable=AsyncMock,
+                side_effect=[extracted("Jobs"), AuthenticationError("signed out")],
+            ),
+            patch.object(
+                extractor,
+                "_extract_job_ids",
+                new_callable=AsyncMock,
+                return_value=["111"],
+            ),
+            patch.object(
+                extractor,
+                "_get_total_search_pages",
+                new_callable=AsyncMock,
+                return_value=3,
+            ),
+            patch(
+                "linkedin_mcp_server.scraping.extractor.asyncio.sleep",
+                new_callable=AsyncMock,
+            ),
+        ):
+            with pytest.raises(AuthenticationError):
+                await extractor.search_jobs("python", max_pages=3, callbacks=callbacks)
+
+        callbacks.on_progress.assert_awaited_once()
+        callbacks.on_error.assert_awaited_once()
+        assert isinstance(callbacks.on_error.call_args.args[0], AuthenticationError)
+
     async def test_returns_references(self, mock_page):
         extractor = LinkedInExtractor(mock_page)
         with (
@@ -3117,6 +3296,36 @@ class TestSearchPeople:
         assert "network=%5B%22F%22%5D" in result["url"]
         assert "currentCompany=%5B%221115%22%5D" in result["url"]
 
+    async def test_search_people_repeat_is_served_from_cache(self, mock_page):
+        extractor = LinkedInExtractor(mock_page)
+        with patch.object(
+            extractor,
+            "extract_page",
+            new_callable=AsyncMock,
+            return_value=extracted("Jane Doe"),
+        ) as mock_extract:
+            first = await extractor.search_people("engineer", use_cache=True)
+            second = await extractor.search_people("engineer", use_cache=True)
+            await extractor.search_people("engineer", "Berlin", use_cache=True)
+
+        assert second == first
+        assert mock_extract.await_count == 2
+
+    async def test_search_people_rate_limited_result_is_not_cached(self, mock_page):
+        extractor = LinkedInExtractor(mock_page)
+        with patch.object(
+            extractor,
+            "extract_page",
+            new_callable=AsyncMock,
+            side_effect=[extracted(_RATE_LIMITED_MSG), extracted("Jane Doe")],
+        ) as mock_extract:
+            first = await extractor.search_people("engineer", use_cache=True)
+            second = await extractor.search_people("engineer", use_cache=True)
+
+        assert "section_errors" in first
+        assert second["sections"] == {"search_results": "Jane Doe"}
+        assert mock_extract.await_count == 2
+
 
 class TestBuildContentSearchUrl:
     """Tests for _build_content_search_url URL construction."""
@@ -3231,6 +3440,7 @@ class TestSearchPosts:
 
     async def test_rate_limited_surfaces_section_error(self, mock_page):
         extractor = LinkedInExtractor(mock_page)
+        extractor._retry_after = 45.0
         with patch.object(
             extractor,
             "extract_page",
@@ -3240,7 +3450,11 @@ class TestSearchPosts:
             result = await extractor.search_posts("python")
 
         assert result["sections"] == {}
-        assert result["section_errors"]["search_results"]["error_type"] == "rate_limit"
+        assert result["section_errors"]["search_results"] == {
+            "error_type": "rate_limit",
+            "error_message": _RATE_LIMITED_MSG,
+            "retry_after_seconds": 45,
+        }
 
     async def test_navigation_error_surfaces_section_error(self, mock_page):
         extractor = LinkedInExtractor(mock_page)
@@ -3737,7 +3951,6 @@ class TestActivityFeedExtraction:
         # count() returns 1, 1, 0 across iterations — button disappears on 3rd check
         show_more.count = AsyncMock(side_effect=[1, 1, 0])
         show_more.is_visible = AsyncMock(return_value=True)
-        show_more.scroll_into_view_if_needed = AsyncMock()
         show_more.click = AsyncMock()
         show_more.first = show_more
         show_more.filter = MagicMock(return_value=show_more)
@@ -3775,6 +3988,8 @@ class TestActivityFeedExtraction:
             )
 
         assert show_more.click.await_count == 2
+        # click() scrolls the button into view itself.
+        show_more.scroll_into_view_if_needed.assert_not_called()
 
     async def test_details_page_show_more_respects_max_scrolls_budget(self, mock_page):
         """When 'Show more' never disappears, loop exits after max_scrolls clicks."""
@@ -3786,7 +4001,6 @@ class TestActivityFeedExtraction:
         show_more = MagicMock()
         show_more.count = AsyncMock(return_value=1)  # always present
         show_more.is_visible = AsyncMock(return_value=True)
-        show_more.scroll_into_view_if_needed = AsyncMock()
         show_more.click = AsyncMock()
         show_more.first = show_more
         show_more.filter = MagicMock(return_value=show_more)
@@ -4143,6 +4357,65 @@ class TestScrapePersonCallbacks:
         assert cb.on_complete.call_args[0][0] == "person profile"
         cb.on_error.assert_not_awaited()
 
+    async def test_cached_profile_is_served_without_navigating(self, mock_page):
+        extractor = LinkedInExtractor(mock_page)
+        cb = MagicMock(spec=ProgressCallback)
+        cb.on_start = AsyncMock()
+        cb.on_progress = AsyncMock()
+        cb.on_complete = AsyncMock()
+
+        with (
+            patch.object(
+                extractor,
+                "extract_page",
+                new_callable=AsyncMock,
+                return_value=extracted("text"),
+            ) as mock_extract,
+            patch.object(
+                extractor,
+                "_extract_profile_urn",
+                new_callable=AsyncMock,
+                return_value=None,
+            ),
+            patch(
+                "linkedin_mcp_server.scraping.extractor.asyncio.sleep",
+                new_callable=AsyncMock,
+            ),
+        ):
+            first = await extractor.scrape_person(
+                "testuser", {"experience"}, use_cache=True
+            )
+            second = await extractor.scrape_person(
+                "testuser", {"experience"}, callbacks=cb, use_cache=True
+            )
+            await extractor.scrape_person("testuser", {"experience"})
+
+        assert second == first
+        # Two sections for the first call, none for the cached repeat, and two
+        # again for the call that did not ask for the cache.
+        assert mock_extract.await_count == 4
+        cb.on_start.assert_not_awaited()
+        cb.on_complete.assert_awaited_once()
+
+    async def test_rate_limited_profile_is_not_cached(self, mock_page):
+        extractor = LinkedInExtractor(mock_page)
+        with (
+            patch.object(
+                extractor,
+                "extract_page",
+                new_callable=AsyncMock,
+                return_value=extracted(_RATE_LIMITED_MSG),
+            ) as mock_extract,
+            patch(
+                "linkedin_mcp_server.scraping.extractor.asyncio.sleep",
+                new_callable=AsyncMock,
+            ),
+        ):
+            await extractor.scrape_person("testuser", set(), use_cache=True)
+            await extractor.scrape_person("testuser", set(), use_cache=True)
+
+        assert mock_extract.await_count == 2
+
     async def test_scrape_person_no_callbacks_by_default(self, mock_page):
         """Without callbacks, scrape_person works identically to before."""
         extractor = LinkedInExtractor(mock_page)
@@ -5743,6 +6016,35 @@ class TestSendMessageComposerInteraction:
         mock_keyboard.press.assert_awaited_once_with("Enter")
 
 
+class TestFeedResponseListener:
+    async def test_permalinks_are_read_from_raw_bodies(self, mock_page):
+        """Escaped and plain permalinks both come out as canonical URLs."""
+        extractor = LinkedInExtractor(mock_page)
+        body = (
+            b'<script>self.__next_f.push([1,"https:\\u002F\\u002Fwww.linkedin.com'
+            b'\\u002Fposts\\u002Fjane-doe_hello-activity-7123-AbCd"])</script>'
+            b'\xff{"postSlugUrl":"https://www.linkedin.com/posts/'
+            b'bob_launch-ugcPost-99-zZ"}'
+        )
+        captured: dict[str, list[str]] = {}
+
+        async def fire_one(url, num_posts, captured_urls, pending_reads):
+            captured["urls"] = captured_urls
+            resp = MagicMock()
+            resp.url = "https://www.linkedin.com/feed/"
+            resp.body = AsyncMock(return_value=body)
+            mock_page.on.call_args.args[1](resp)
+            return extracted("feed text")
+
+        with patch.object(extractor, "_extract_feed_body", side_effect=fire_one):
+            await extractor._extract_feed_once(num_posts=5)
+
+        assert captured["urls"] == [
+            "https://www.linkedin.com/posts/jane-doe_hello-activity-7123-AbCd",
+            "https://www.linkedin.com/posts/bob_launch-ugcPost-99-zZ",
+        ]
+
+
 class TestBuildFeedReferences:
     """Tests for _build_feed_references SDUI-capture / DOM-anchor merging."""
 
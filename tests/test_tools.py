@@ -118,6 +118,7 @@ class TestPersonTool:
         call_kwargs = mock_extractor.scrape_person.call_args.kwargs
         assert "callbacks" in call_kwargs
         assert isinstance(call_kwargs["callbacks"], MCPContextProgressCallback)
+        assert call_kwargs["use_cache"] is True
 
     async def test_get_person_profile_passes_max_scrolls(self, mock_context):
         """Verify max_scrolls parameter is forwarded to scrape_person."""
@@ -267,6 +268,7 @@ class TestPersonTool:
             "New York",
             network=None,
             current_company=None,
+            use_cache=True,
         )
 
     async def test_search_people_with_network_and_company_filters(self, mock_context):
@@ -301,6 +303,7 @@ class TestPersonTool:
             None,
             network=["F"],
             current_company="1115",
+            use_cache=True,
         )
 
     async def test_search_people_validation_error_surfaced_as_tool_error(
@@ -550,6 +553,7 @@ class TestCompanyTools:
         mock_extractor.extract_page = AsyncMock(
             return_value=ExtractedSection(text=_RATE_LIMITED_MSG, references=[])
         )
+        mock_extractor.retry_after = 600.0
 
         from linkedin_mcp_server.tools.company import register_company_tools
 
@@ -560,6 +564,7 @@ class TestCompanyTools:
         result = await tool_fn("testcorp", mock_context, extractor=mock_extractor)
         assert result["sections"] == {}
         assert result["section_errors"]["posts"]["error_type"] == "rate_limit"
+        assert result["section_errors"]["posts"]["retry_after_seconds"] == 600
 
     async def test_get_company_posts_returns_section_errors(self, mock_context):
         mock_extractor = MagicMock()
@@ -645,6 +650,8 @@ class TestJobTools:
         )
         assert "search_results" in result["sections"]
         assert "pages_visited" not in result
+        call_kwargs = mock_extractor.search_jobs.call_args.kwargs
+        assert isinstance(call_kwargs["callbacks"], MCPContextProgressCallback)
 
     async def test_get_saved_jobs(self, mock_context):
         expected = {
@@ -979,7 +986,9 @@ class TestSearchCompaniesTool:
         tool_fn = await get_tool_fn(mcp, "search_companies")
         result = await tool_fn("fintech", mock_context, extractor=mock_extractor)
         assert "search_results" in result["sections"]
-        mock_extractor.search_companies.assert_awaited_once_with("fintech")
+        mock_extractor.search_companies.assert_awaited_once_with(
+            "fintech", use_cache=True
+        )
 
     async def test_search_companies_error(self, mock_context):
         from fastmcp.exceptions import ToolError
@@ -1118,6 +1127,7 @@ class TestFeedTools:
         mock_extractor.extract_feed = AsyncMock(
             return_value=ExtractedSection(text=_RATE_LIMITED_MSG, references=[])
         )
+        mock_extractor.retry_after = None
 
         from linkedin_mcp_server.tools.feed import register_feed_tools
 
@@ -1129,6 +1139,7 @@ class TestFeedTools:
         assert "feed" not in result["sections"]
         assert result["section_errors"]["feed"]["error_type"] == "rate_limit"
         assert result["section_errors"]["feed"]["error_message"] == _RATE_LIMITED_MSG
+        assert "retry_after_seconds" not in result["section_errors"]["feed"]
 
     async def test_get_feed_returns_section_errors(self, mock_context):
         mock_extractor = MagicMock()